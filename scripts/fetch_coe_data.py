@@ -10,16 +10,34 @@ Run manually:   python3 scripts/fetch_coe_data.py
 Run via CI:     .github/workflows/fetch.yml
 """
 
+import bisect
+import email.utils
+import gzip
 import json
+import os
 import random
 import ssl
 import sys
+import threading
 import time
 import urllib.request
 import urllib.error
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
+from typing import Iterable, TypedDict
 from pathlib import Path
-from calendar import monthrange
+
+try:
+    import certifi  # Optional: bundled CA certs (system certs used otherwise)
+except ImportError:
+    certifi = None
+
+try:
+    import orjson  # Optional: much faster serialization, byte-identical output
+except ImportError:
+    orjson = None
 
 # ── Config ──────────────────────────────────────────────────────────────
 
@@ -34,6 +52,10 @@ SGT = timezone(timedelta(hours=8))
 REPO_ROOT = Path(__file__).resolve().parent.parent
 OUTPUT_DIR = REPO_ROOT / "v1"
 
+# Cached HTTP validators (ETag / Last-Modified) from the last successful fetch.
+# Kept under .github/, which the Pages artifact excludes, so it isn't published.
+STATE_PATH = REPO_ROOT / ".github" / "fetch_state.json"
+
 # Maps data.gov.sg "vehicle_class" to our short category key
 CATEGORY_MAP = {
     "Category A": "A",
@@ -44,24 +66,54 @@ CATEGORY_MAP = {
 }
 
 
+class COERoundResult(TypedDict):
+    """One bidding round as written to history.json (Swift COERoundResult)."""
+    id: str
+    biddingDate: str
+    roundLabel: str
+    prices: dict[str, int]
+    quotas: dict[str, int]
+    bidsReceived: dict[str, int]
+    bidsSuccess: dict[str, int]
+
+
 # ── Helpers ─────────────────────────────────────────────────────────────
 
-def parse_int(s: str) -> int:
+def parse_int(s: str | int) -> int:
     """Parse an integer from a string that may contain commas."""
-    return int(s.replace(",", ""))
+    if isinstance(s, int):
+        return s
+    return int(s.replace(",", "")) if "," in s else int(s)
+
+
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_SAKAMOTO_OFFSETS = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+
+def _first_weekday(year: int, month: int) -> int:
+    """Weekday of the 1st of the month (0=Mon..6=Sun), via Sakamoto's method."""
+    if month < 3:
+        year -= 1
+    return (year + year // 4 - year // 100 + year // 400 + _SAKAMOTO_OFFSETS[month - 1]) % 7
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
 
 
 def nth_weekday_of_month(year: int, month: int, weekday: int, n: int) -> int:
     """Return the day-of-month for the nth occurrence of weekday (0=Mon..6=Sun)."""
-    first_day_weekday = datetime(year, month, 1).weekday()  # 0=Mon
     # Days until first occurrence of target weekday
-    diff = (weekday - first_day_weekday) % 7
+    diff = (weekday - _first_weekday(year, month)) % 7
     day = 1 + diff + (n - 1) * 7
     # Clamp to valid range for the month
-    _, max_day = monthrange(year, month)
-    return min(day, max_day)
+    return min(day, _days_in_month(year, month))
 
 
+@lru_cache(maxsize=None)
 def bidding_date_for(month_str: str, bidding_no: int) -> str:
     """
     Compute the bidding close datetime for a round.
@@ -76,34 +128,105 @@ def bidding_date_for(month_str: str, bidding_no: int) -> str:
     return dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+@lru_cache(maxsize=None)
 def round_label_for(month_str: str, bidding_no: int) -> str:
     """E.g. 'Jan 2025 Ex 1'."""
-    dt = datetime.strptime(month_str, "%Y-%m")
-    return f"{dt.strftime('%b %Y')} Ex {bidding_no}"
+    year, month = month_str[:4], int(month_str[5:7])
+    return f"{_MONTH_ABBRS[month - 1]} {year} Ex {bidding_no}"
 
 
 # ── Main ────────────────────────────────────────────────────────────────
 
 MAX_RETRIES = 4
-RETRY_DELAYS = [60, 120, 300, 600]  # seconds — long enough to outlast 429 windows
+RETRY_BASE_DELAY = 60   # seconds — long enough to outlast 429 windows
+RETRY_MAX_DELAY = 600
+RETRY_JITTER = 15       # spread concurrent runners so they don't retry in lockstep
+
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Seconds to wait before retrying after a 429.
+    Honors the server's Retry-After (delta-seconds or HTTP-date) when present,
+    otherwise uses jittered exponential backoff. Capped at RETRY_MAX_DELAY.
+    """
+    if retry_after:
+        try:
+            return min(max(0, int(retry_after)), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+        try:
+            when = email.utils.parsedate_to_datetime(retry_after)
+            wait = (when - datetime.now(timezone.utc)).total_seconds()
+            return min(max(0, wait), RETRY_MAX_DELAY)
+        except (TypeError, ValueError):
+            pass
+    delay = min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+    return delay + random.uniform(0, RETRY_JITTER)
 
 
 def _make_ssl_context() -> ssl.SSLContext:
     """Create an SSL context, trying certifi first, then system certs."""
-    try:
-        import certifi
+    if certifi is not None:
         return ssl.create_default_context(cafile=certifi.where())
-    except ImportError:
-        pass
     # Fallback: default context (works on CI / most Linux)
     return ssl.create_default_context()
 
 
-def fetch_records() -> list[dict] | None:
+@lru_cache(maxsize=None)
+def _opener() -> urllib.request.OpenerDirector:
+    """Shared URL opener so every request in the run reuses one SSL context."""
+    return urllib.request.build_opener(urllib.request.HTTPSHandler(context=_make_ssl_context()))
+
+
+def _loads(buf: bytes):
+    """Parse JSON straight from bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _read_body(resp) -> bytes:
+    """Read a response body, decompressing it if the server sent gzip."""
+    raw = resp.read()
+    encoding = (resp.headers.get("Content-Encoding") or "").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(raw)
+    return raw
+
+
+# Returned by fetch_records() when the API answers 304 Not Modified
+NOT_MODIFIED = object()
+
+
+def _load_fetch_state(url: str) -> dict:
+    """
+    Load the validators saved by the previous successful fetch of url.
+    Validators saved for a different query (e.g. another FETCH_LIMIT) are ignored.
+    """
+    try:
+        state = _loads(STATE_PATH.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return {}
+    if not isinstance(state, dict) or state.get("url") != url:
+        return {}
+    return state
+
+
+def _save_fetch_state(state: dict) -> None:
+    """Persist response validators for the next conditional request."""
+    _write_atomic(STATE_PATH, (json.dumps(state, indent=2) + "\n").encode())
+
+
+def fetch_records() -> tuple[list[dict] | object | None, dict | None]:
     """
     Fetch raw records from data.gov.sg with retry on rate limiting.
+    Sends If-None-Match / If-Modified-Since from the previous fetch and
+    returns NOT_MODIFIED if the server answers 304.
     Returns None if the API is unavailable after all retries (caller should
     fall back to existing CDN data).
+
+    Also returns the response's validators; the caller saves them with
+    _save_fetch_state() once the outputs are written.
     """
     params = (
         f"resource_id={RESOURCE_ID}"
@@ -112,31 +235,44 @@ def fetch_records() -> list[dict] | None:
     )
     url = f"{DATA_GOV_URL}?{params}"
 
-    ctx = _make_ssl_context()
+    state = _load_fetch_state(url)
 
     for attempt in range(1, MAX_RETRIES + 1):
         print(f"Fetching {url} (attempt {attempt}/{MAX_RETRIES})")
 
         req = urllib.request.Request(url)
         req.add_header("User-Agent", "COE-SG-GitHub-Actions/1.0")
+        req.add_header("Accept-Encoding", "gzip")
+        if state.get("etag"):
+            req.add_header("If-None-Match", state["etag"])
+        if state.get("last_modified"):
+            req.add_header("If-Modified-Since", state["last_modified"])
 
         try:
-            with urllib.request.urlopen(req, timeout=30, context=ctx) as resp:
-                data = json.loads(resp.read().decode())
+            with _opener().open(req, timeout=30) as resp:
+                data = _loads(_read_body(resp))
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
         except urllib.error.HTTPError as e:
+            if e.code == 304:
+                print("Not modified (304) since last fetch")
+                return NOT_MODIFIED, None
             if e.code == 429:
                 if attempt < MAX_RETRIES:
-                    delay = RETRY_DELAYS[attempt - 1]
-                    print(f"Rate limited (429), retrying in {delay}s...")
+                    delay = _retry_delay(attempt, e.headers.get("Retry-After"))
+                    print(f"Rate limited (429), retrying in {delay:.0f}s...")
                     time.sleep(delay)
                     continue
                 print("Rate limited (429) after all retries — will use CDN data", file=sys.stderr)
-                return None
+                return None, None
             print(f"HTTP error {e.code}: {e.reason}", file=sys.stderr)
-            return None
+            return None, None
         except urllib.error.URLError as e:
             print(f"URL error: {e.reason}", file=sys.stderr)
-            return None
+            return None, None
+        except (EOFError, zlib.error, gzip.BadGzipFile) as e:
+            print(f"Corrupt gzip response: {e}", file=sys.stderr)
+            return None, None
 
         # Handle rate limit returned as JSON (non-HTTP-429 variant)
         if data.get("code") == 24 or data.get("name") == "TOO_MANY_REQUESTS":
@@ -146,29 +282,29 @@ def fetch_records() -> list[dict] | None:
                 time.sleep(delay)
                 continue
             print("Rate limit exceeded after all retries — will use CDN data", file=sys.stderr)
-            return None
+            return None, None
 
         if not data.get("success"):
             print(f"API returned success=false: {json.dumps(data)[:200]}", file=sys.stderr)
-            return None
+            return None, None
 
         records = data["result"]["records"]
         print(f"Fetched {len(records)} records")
-        return records
+        return records, {"url": url, "etag": etag, "last_modified": last_modified}
 
     print("All retry attempts exhausted — will use CDN data", file=sys.stderr)
-    return None
+    return None, None
 
 
-def load_existing_history() -> list[dict]:
+def load_existing_history() -> list[COERoundResult]:
     """Load existing history from CDN to avoid re-fetching immutable historical data."""
     try:
         print(f"Loading existing history from CDN...")
-        ctx = _make_ssl_context()
         req = urllib.request.Request(CDN_HISTORY_URL)
         req.add_header("User-Agent", "COE-SG-GitHub-Actions/1.0")
-        with urllib.request.urlopen(req, timeout=30, context=ctx) as resp:
-            existing = json.loads(resp.read().decode())
+        req.add_header("Accept-Encoding", "gzip")
+        with _opener().open(req, timeout=30) as resp:
+            existing = _loads(_read_body(resp))
         print(f"  Loaded {len(existing)} existing rounds from CDN")
         return existing
     except Exception as e:
@@ -176,20 +312,22 @@ def load_existing_history() -> list[dict]:
         return []
 
 
-def group_into_rounds(records: list[dict]) -> list[dict]:
+def group_into_rounds(records: Iterable[dict]) -> list[COERoundResult]:
     """
     Group flat API records into COERoundResult-shaped dicts.
+    Records are consumed in a single pass, so any iterable works.
     Returns sorted by biddingDate descending.
     """
-    grouped: dict[str, dict] = {}
+    grouped: dict[str, COERoundResult] = {}
 
     for rec in records:
         month = rec["month"]
         bidding_no = int(rec["bidding_no"])
         key = f"{month}-{bidding_no}"
 
-        if key not in grouped:
-            grouped[key] = {
+        rnd = grouped.get(key)
+        if rnd is None:
+            rnd = grouped[key] = {
                 "id": key,
                 "biddingDate": bidding_date_for(month, bidding_no),
                 "roundLabel": round_label_for(month, bidding_no),
@@ -199,22 +337,21 @@ def group_into_rounds(records: list[dict]) -> list[dict]:
                 "bidsSuccess": {},
             }
 
-        cat_key = rec.get("vehicle_class", "")
-        cat = CATEGORY_MAP.get(cat_key)
-        if not cat:
+        cat = CATEGORY_MAP.get(rec.get("vehicle_class"))
+        if cat is None:
             continue
 
-        grouped[key]["prices"][cat] = parse_int(rec.get("premium", "0"))
-        grouped[key]["quotas"][cat] = parse_int(rec.get("quota", "0"))
-        grouped[key]["bidsReceived"][cat] = parse_int(rec.get("bids_received", "0"))
-        grouped[key]["bidsSuccess"][cat] = parse_int(rec.get("bids_success", "0"))
+        rnd["prices"][cat] = parse_int(rec.get("premium", "0"))
+        rnd["quotas"][cat] = parse_int(rec.get("quota", "0"))
+        rnd["bidsReceived"][cat] = parse_int(rec.get("bids_received", "0"))
+        rnd["bidsSuccess"][cat] = parse_int(rec.get("bids_success", "0"))
 
     # Sort by biddingDate descending
     rounds = sorted(grouped.values(), key=lambda r: r["biddingDate"], reverse=True)
     return rounds
 
 
-def build_latest_snapshot(rounds: list[dict]) -> dict:
+def build_latest_snapshot(rounds: list[COERoundResult]) -> dict:
     """Build a COELatestSnapshot-shaped dict from the first two rounds."""
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     return {
@@ -224,13 +361,47 @@ def build_latest_snapshot(rounds: list[dict]) -> dict:
     }
 
 
-def write_json(path: Path, data) -> None:
-    """Write JSON to file with consistent formatting."""
+# write_json may run on worker threads; keep their log lines whole
+_print_lock = threading.Lock()
+
+
+def _log(msg: str) -> None:
+    with _print_lock:
+        print(msg)
+
+
+def _write_atomic(path: Path, buf: bytes) -> None:
+    """Write buf to a sibling temp file, fsync it, then rename it over path."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    print(f"Wrote {path} ({path.stat().st_size} bytes)")
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json(path: Path, data) -> bool:
+    """
+    Write JSON to file with consistent formatting, skipping identical output.
+    The file is replaced atomically, so readers never see a partial write.
+    Returns True if the file was written.
+    """
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        buf = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode()
+    # Cheap size check first; only read the file back when lengths match
+    if path.exists() and path.stat().st_size == len(buf) and path.read_bytes() == buf:
+        _log(f"Unchanged {path} ({len(buf)} bytes), skipping write")
+        return False
+    _write_atomic(path, buf)
+    _log(f"Wrote {path} ({len(buf)} bytes)")
+    return True
 
 
 # Keys that change every run and should be ignored when comparing data
@@ -251,54 +422,77 @@ def _data_changed(path: Path, new_data) -> bool:
     if not path.exists():
         return True
     try:
-        with open(path) as f:
-            existing = json.load(f)
+        existing = _loads(path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return True
     return _strip_timestamps(existing) != _strip_timestamps(new_data)
 
 
-def build_analytics(rounds: list[dict]) -> dict:
+def _write_if_changed(path: Path, data) -> bool:
+    """Write data unless only its timestamps differ. Returns True if written."""
+    if _data_changed(path, data):
+        return write_json(path, data)
+    _log(f"No data change for {path.name}, skipping write")
+    return False
+
+
+def build_analytics(rounds: list[COERoundResult]) -> dict:
     """
     Build per-category analytics from historical rounds.
     Output: v1/analytics.json
     """
-    import statistics
-
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     categories = ["A", "B", "C", "D", "E"]
     per_category = {}
 
-    for cat in categories:
-        prices_with_dates = []
-        for r in rounds:
-            p = r["prices"].get(cat)
-            if p is not None:
-                prices_with_dates.append((p, r["biddingDate"]))
+    # Split rounds into per-category columns in one pass, parsing each
+    # bidding date once (the YoY search below works on timestamps).
+    # Columns keep the rounds' newest-first order.
+    columns = {cat: ([], []) for cat in categories}
+    for r in rounds:
+        date = r["biddingDate"]
+        ts = datetime.fromisoformat(date.replace("Z", "+00:00")).timestamp()
+        for cat, p in r["prices"].items():
+            column = columns.get(cat)
+            if column is not None and p is not None:
+                column[0].append((p, date))
+                column[1].append(ts)
 
+    for cat in categories:
+        prices_with_dates, cat_timestamps = columns[cat]
         if not prices_with_dates:
             continue
 
-        prices = [pw[0] for pw in prices_with_dates]
-        avg = int(statistics.mean(prices))
-        med = int(statistics.median(prices))
-
-        min_entry = min(prices_with_dates, key=lambda x: x[0])
-        max_entry = max(prices_with_dates, key=lambda x: x[0])
+        # Sum, min and max in a single pass; ties keep the latest round
+        total = 0
+        min_entry = max_entry = prices_with_dates[0]
+        for entry in prices_with_dates:
+            p = entry[0]
+            total += p
+            if p < min_entry[0]:
+                min_entry = entry
+            elif p > max_entry[0]:
+                max_entry = entry
+
+        n = len(prices_with_dates)
+        avg = total // n
+        prices = sorted(pw[0] for pw in prices_with_dates)
+        mid = n // 2
+        med = prices[mid] if n % 2 else (prices[mid - 1] + prices[mid]) // 2
 
         # YoY change: latest price vs price ~1 year ago
         yoy_change = None
         if len(prices_with_dates) >= 2:
             latest_price = prices_with_dates[0][0]  # rounds are sorted desc
-            # Find the round closest to 1 year ago
-            latest_date = datetime.fromisoformat(prices_with_dates[0][1].replace("Z", "+00:00"))
-            one_year_ago = latest_date - timedelta(days=365)
-            closest = min(
-                prices_with_dates[1:],
-                key=lambda x: abs(
-                    (datetime.fromisoformat(x[1].replace("Z", "+00:00")) - one_year_ago).total_seconds()
-                ),
-            )
+            # Find the round closest to 1 year ago; on a tie prefer the later round
+            one_year_ago = cat_timestamps[0] - timedelta(days=365).total_seconds()
+            older = cat_timestamps[:0:-1]  # all but the latest, oldest first
+            i = bisect.bisect_left(older, one_year_ago)
+            if i == len(older) or (i > 0 and one_year_ago - older[i - 1] < older[i] - one_year_ago):
+                k = i - 1
+            else:
+                k = bisect.bisect_right(older, older[i]) - 1
+            closest = prices_with_dates[len(older) - k]
             yoy_change = latest_price - closest[0]
 
         per_category[cat] = {
@@ -307,7 +501,7 @@ def build_analytics(rounds: list[dict]) -> dict:
             "min": {"price": min_entry[0], "date": min_entry[1]},
             "max": {"price": max_entry[0], "date": max_entry[1]},
             "yoyChange": yoy_change,
-            "dataPoints": len(prices),
+            "dataPoints": n,
         }
 
     return {
@@ -328,10 +522,12 @@ def build_schedule() -> dict:
     exercise = 1  # Start checking from exercise 1 of current month
 
     while len(schedules) < 4:
+        # 1st Wednesday of the month (2 = Wednesday); the 3rd is two weeks later
+        first_wed = 1 + (2 - _first_weekday(year, month)) % 7
         for ex in (1, 3):
             if exercise > 1 and ex < exercise:
                 continue
-            wed_day = nth_weekday_of_month(year, month, 2, ex)  # 2 = Wednesday
+            wed_day = first_wed + (ex - 1) * 7
             closing_sgt = datetime(year, month, wed_day, 16, 0, 0, tzinfo=SGT)
 
             if closing_sgt <= now_sgt:
@@ -364,14 +560,32 @@ def build_schedule() -> dict:
     }
 
 
+def schedule_stale(path: Path) -> bool:
+    """Return True if the schedule file is missing or its next closing date has passed."""
+    try:
+        upcoming = _loads(path.read_bytes())["upcoming"]
+    except (json.JSONDecodeError, OSError, KeyError, TypeError):
+        return True
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return not upcoming or upcoming[0]["closingDate"] <= now
+
+
 def main():
-    # Load existing CDN data first (avoids re-fetching immutable history)
+    # Fetch only the most recent records from data.gov.sg
+    records, fetch_state = fetch_records()
+
+    if records is NOT_MODIFIED:
+        # The schedule rolls forward with the clock even when the data doesn't
+        schedule_path = OUTPUT_DIR / "schedule.json"
+        if schedule_stale(schedule_path):
+            write_json(schedule_path, build_schedule())
+        print("\nUpstream data unchanged — nothing else to update")
+        return
+
+    # Load existing CDN data (avoids re-fetching immutable history)
     existing_rounds = load_existing_history()
     existing_by_id = {r["id"]: r for r in existing_rounds}
 
-    # Fetch only the most recent records from data.gov.sg
-    records = fetch_records()
-
     if records is None:
         # API unavailable — fall back to existing CDN data
         if not existing_rounds:
@@ -398,24 +612,38 @@ def main():
             print("No rounds after merge, skipping write", file=sys.stderr)
             sys.exit(1)
 
-    snapshot = build_latest_snapshot(rounds)
-    analytics = build_analytics(rounds)
-    schedule = build_schedule()
+    history_path = OUTPUT_DIR / "history.json"
+    analytics_path = OUTPUT_DIR / "analytics.json"
+    schedule_path = OUTPUT_DIR / "schedule.json"
 
-    files = {
-        OUTPUT_DIR / "latest.json": snapshot,
-        OUTPUT_DIR / "history.json": rounds,
-        OUTPUT_DIR / "analytics.json": analytics,
-        OUTPUT_DIR / "schedule.json": schedule,
-    }
+    history_changed = _data_changed(history_path, rounds)
+
+    # The files are independent, so write each one in the background while
+    # the next is being built
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        writes = []
+        if history_changed:
+            writes.append(pool.submit(write_json, history_path, rounds))
+        else:
+            _log(f"No data change for {history_path.name}, skipping write")
+        writes.append(pool.submit(_write_if_changed, OUTPUT_DIR / "latest.json", build_latest_snapshot(rounds)))
 
-    changed = False
-    for path, data in files.items():
-        if _data_changed(path, data):
-            write_json(path, data)
-            changed = True
+        # Analytics derive purely from history; the schedule also goes stale with time
+        if history_changed or not analytics_path.exists():
+            writes.append(pool.submit(_write_if_changed, analytics_path, build_analytics(rounds)))
+        else:
+            _log(f"History unchanged, skipping {analytics_path.name}")
+        if history_changed or schedule_stale(schedule_path):
+            writes.append(pool.submit(_write_if_changed, schedule_path, build_schedule()))
         else:
-            print(f"No data change for {path.name}, skipping write")
+            _log(f"Schedule still current, skipping {schedule_path.name}")
+
+    changed = any([w.result() for w in writes])
+
+    # Only remember the validators once every output reflects this response,
+    # otherwise a failed run would be followed by 304s and never rebuilt
+    if fetch_state is not None:
+        _save_fetch_state(fetch_state)
 
     if not changed:
         print("\nNo data changes detected — nothing to update")